@@ -1,10 +1,14 @@
 from fnmatch import fnmatch
+from functools import lru_cache
 from pathlib import Path
 from shutil import rmtree
-from typing import List
+from typing import Tuple
 
 
-def fnmatch_any(name: str, patterns: List[str]):
+@lru_cache(maxsize=4096)
+def fnmatch_any(name: str, patterns: Tuple[str, ...]):
+    # names repeat heavily during walks (e.g. __init__.py), so results are
+    # memoized; patterns have to be a tuple, as cache keys must be hashable
     for pattern in patterns:
         if fnmatch(name, pattern):
             return True
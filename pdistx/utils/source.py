@@ -1,27 +1,80 @@
 import ast
+import hashlib
+import os
+import pickle
 import re
+import sys
+from functools import lru_cache
 from pathlib import Path
 
+# parsed trees are cached on disk keyed by source hash, so repeated runs on
+# unchanged files skip parsing entirely; keyed per python version, as pickled
+# trees are not portable across versions
+_AST_CACHE_DIR = Path.home().joinpath('.cache', 'pdistx', 'ast')
+_AST_CACHE_TAG = '{}.{}'.format(sys.version_info.major, sys.version_info.minor)
+
+
+def _ast_cache_path(code: str, type_comments: bool):
+    key = hashlib.sha256(code.encode('utf-8', 'replace')).hexdigest()
+    tag = _AST_CACHE_TAG if type_comments else _AST_CACHE_TAG + '-ntc'
+    return _AST_CACHE_DIR.joinpath(key + '-' + tag + '.pkl')
+
+
+def ast_parse(code: str, type_comments: bool = True):
+    cache_path = _ast_cache_path(code, type_comments)
+
+    # reuse the cached tree if available (each load yields a fresh tree); the
+    # read is best effort by design, so any broken entry, whatever error it
+    # raises on unpickling, falls through to a regular parse
+    try:
+        with open(cache_path, 'rb') as file:
+            return pickle.load(file)
+    except Exception:
+        pass
 
-def ast_parse(code: str):
     try:
-        return ast.parse(code, type_comments=True)
+        tree = ast.parse(code, type_comments=type_comments)
     except:
-        return ast.parse(code, type_comments=True, feature_version=(3, 4))
+        tree = ast.parse(code, type_comments=type_comments, feature_version=(3, 4))
+
+    # store the tree for future runs (best effort, caching must never fail a
+    # run, whatever the pickler raises); written to a temporary file and moved
+    # into place atomically, so concurrent workers only ever see complete
+    # entries, and any partial file is removed again on failure
+    try:
+        _AST_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name('{}.{}.tmp'.format(cache_path.name, os.getpid()))
+        try:
+            with open(tmp_path, 'wb') as file:
+                pickle.dump(tree, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        finally:
+            if tmp_path.exists():
+                os.unlink(tmp_path)
+    except Exception:
+        pass
+
+    return tree
+
+
+@lru_cache(maxsize=256)
+def ast_parse_cached(code: str):
+    # memoized variant for read-only consumers, avoids re-parsing the same
+    # source within one run; the returned tree is shared between calls and
+    # must not be mutated (transforms have to use ast_parse instead); type
+    # comments are skipped, as no read-only consumer inspects them and the
+    # parser is measurably faster without the extra bookkeeping
+    return ast_parse(code, type_comments=False)
 
 
 def ast_unparse(node):
     return ast.unparse(node)
 
 
-def detect_source_encoding(path: Path):
+def _detect_source_encoding(lines):
     # according to PEP 0263
     # https://www.python.org/dev/peps/pep-0263/
 
-    # read first two lines
-    with open(path, 'rb') as file:
-        lines = [file.readline(), file.readline()]
-
     # check if first line starts with a bom
     if lines[0].startswith(b'\xef\xbb\xbf'):
         return 'utf-8'
@@ -36,19 +89,41 @@ def detect_source_encoding(path: Path):
     return 'utf-8'
 
 
+def detect_source_encoding(path: Path):
+    # read first two lines
+    with open(path, 'rb') as file:
+        lines = [file.readline(), file.readline()]
+
+    return _detect_source_encoding(lines)
+
+
 def read_source(path: Path):
-    # detect encoding
-    encoding = detect_source_encoding(path)
+    # read raw bytes once; encoding detection and decoding happen in memory
+    # instead of opening the file a second time
+    with open(path, 'rb') as file:
+        data = file.read()
+
+    # detect encoding from the first two lines
+    encoding = _detect_source_encoding(data.split(b'\n', 2)[:2])
 
-    # read code with proper encoding
-    with open(path, 'r', encoding=encoding) as file:
-        code = file.read()
+    # decode code with proper encoding
+    code = data.decode(encoding)
 
     # remove all comments including encoding marker and shebang
     # NOTE: purposely done on read and write to cover all cases of pack/vendor/variant
     return ast_unparse(ast_parse(code))
 
 
+def read_source_text(path: Path):
+    # decoded but unnormalized source text, read with a single binary read
+    with open(path, 'rb') as file:
+        data = file.read()
+
+    encoding = _detect_source_encoding(data.split(b'\n', 2)[:2])
+
+    return data.decode(encoding)
+
+
 def write_source(path: Path, code: str):
 
     # remove all comments including encoding marker and shebang
@@ -64,3 +139,19 @@ def write_source(path: Path, code: str):
     # write code as utf-8
     with open(path, 'w', encoding='utf-8') as file:
         file.write(code)
+
+
+def write_source_tree(path: Path, tree):
+    # counterpart of write_source for already parsed trees, avoids one
+    # unparse/parse round trip
+    code = ast_unparse(tree)
+
+    # prepend utf-8 encoding and final newline
+    code = '# coding: utf-8\n' + code
+
+    if not code.endswith('\n'):
+        code += '\n'
+
+    # write code as utf-8
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(code)
@@ -1,53 +1,56 @@
 import ast
+import re
+from functools import lru_cache
 
-from pdistx.utils.source import ast_parse
+from pdistx.utils.source import ast_parse_cached
 
 
-class _HasAbsoluteImportOfModuleCheck(ast.NodeVisitor):
+def _is_module_or_submodule(name, module, prefix):
+    return name == module or name.startswith(prefix)
 
-    def __init__(self, module):
-        self._module = module
-        self.has_absolute_import_of_module = False
-        super().__init__()
 
-    # pylint: disable=pylint(invalid-name)
-    def visit_Import(self, node: ast.Import):
-        self.generic_visit(node)
+def _imports_module(node, module, prefix):
+    # single place deciding whether a node is an absolute import of the
+    # module or one of its submodules
+    if isinstance(node, ast.Import):
+        return any(_is_module_or_submodule(name.name, module, prefix) for name in node.names)
 
-        for name in node.names:
-            if name.name == self._module or name.name.startswith(self._module + '.'):
-                self.has_absolute_import_of_module = True
+    if isinstance(node, ast.ImportFrom):
+        return node.level == 0 and _is_module_or_submodule(node.module, module, prefix)
 
-    # pylint: disable=pylint(invalid-name)
-    def visit_ImportFrom(self, node: ast.ImportFrom):
-        self.generic_visit(node)
-
-        if node.level == 0:
-            if node.module == self._module or node.module.startswith(self._module + '.'):
-                self.has_absolute_import_of_module = True
+    return False
 
 
+@lru_cache(maxsize=1024)
 def has_absolute_import_of_module(source, module):
-    visitor = _HasAbsoluteImportOfModuleCheck(module)
-    visitor.visit(ast_parse(source))
-    return visitor.has_absolute_import_of_module
+    # cheap prefilter: an absolute import of the module requires an import
+    # line mentioning its name, so skip parsing entirely when none exists
+    if not re.search(r'^\s*(?:from|import)\s.*\b' + re.escape(module) + r'\b', source, re.M):
+        return False
 
+    # precomputed once, instead of re-allocating the prefix per visited import
+    prefix = module + '.'
 
-class _HasRelativeImportCheck(ast.NodeVisitor):
+    # return at the first matching import instead of finishing the walk
+    # (ast.walk is breadth-first, so the top-level statements where imports
+    # typically live come first)
+    for node in ast.walk(ast_parse_cached(source)):
+        if _imports_module(node, module, prefix):
+            return True
 
-    def __init__(self):
-        self.has_relative_import = False
-        super().__init__()
+    return False
 
-    # pylint: disable=pylint(invalid-name)
-    def visit_ImportFrom(self, node: ast.ImportFrom):
-        self.generic_visit(node)
 
-        if node.level != 0:
-            self.has_relative_import = True
+@lru_cache(maxsize=1024)
+def has_relative_import(source):
+    # cheap prefilter: a relative import requires a "from ." line; the AST
+    # scan on a positive match rules out false hits inside string literals
+    if not re.search(r'^\s*from\s+\.', source, re.M):
+        return False
 
+    # return at the first relative import instead of finishing the walk
+    for node in ast.walk(ast_parse_cached(source)):
+        if isinstance(node, ast.ImportFrom) and node.level != 0:
+            return True
 
-def has_relative_import(source):
-    visitor = _HasRelativeImportCheck()
-    visitor.visit(ast_parse(source))
-    return visitor.has_relative_import
+    return False
@@ -1,9 +1,12 @@
 from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from os import makedirs, walk
+from os.path import splitext
 from pathlib import Path
 from shutil import copy
 from tempfile import mkdtemp
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from pdistx.utils.path import fnmatch_any, rmpath
 from pdistx.utils.source import read_source, write_source
@@ -13,6 +16,25 @@ from .checks import has_absolute_import_of_module, has_relative_import
 from .transform import file_to_resource_transform
 
 
+def _load_module(entry: Tuple[Path, str, bool], root_name: str, resources: bool):
+    source_file, name, is_package = entry
+
+    # load module code
+    code = read_source(source_file)
+
+    if resources:
+        code = file_to_resource_transform(code)
+
+    # check code for invalid imports
+    if name == '__main__' and has_relative_import(code):
+        raise ValueError(f'{source_file} contains a relative import, which is forbidden')
+
+    if name != '__main__' and has_absolute_import_of_module(code, root_name):
+        raise ValueError(f'{source_file} contains an absolute import of {root_name}, which is forbidden')
+
+    return name, code, is_package
+
+
 def perform(
     source: Path,
     target: Path,
@@ -27,6 +49,9 @@ def perform(
     if zip_:
         assert not target.is_absolute(), 'target path is expected to be relative'
 
+    # filter paths as a set, probed once per walked file and folder
+    filter_set = frozenset(filters)
+
     # list of temporary files and folders
     tmps: List[Path] = []
 
@@ -58,7 +83,8 @@ def perform(
             rmpath(resources_root)
 
         # process all files
-        modules: Dict[str, (str, bool)] = {}
+        modules: Dict[str, Tuple[str, bool]] = {}
+        py_files: List[Tuple[Path, str, bool]] = []
 
         for source_folder, folders, files in walk(source, followlinks=True):
 
@@ -68,13 +94,14 @@ def perform(
 
             if resources:
                 resource_folder = resources_root.joinpath(package_folder)
+                resource_folder_created = False
 
             # filter entries to be ignored (folders need to be modified in-place to take effect for os.walk)
             def _folder_filter(folder: Path):
-                return not fnmatch_any(folder.name, ['__pycache__', '.git']) and folder not in filters
+                return not fnmatch_any(folder.name, ('__pycache__', '.git')) and folder not in filter_set
 
             def _file_filter(file: Path):
-                return not fnmatch_any(file.name, ['*.pyc']) and file not in filters
+                return not fnmatch_any(file.name, ('*.pyc',)) and file not in filter_set
 
             folders[:] = [folder for folder in folders if _folder_filter(source_folder.joinpath(folder))]
             files = [file for file in files if _file_filter(source_folder.joinpath(file))]
@@ -83,49 +110,53 @@ def perform(
             for file in files:
                 source_file = source_folder.joinpath(file)
 
-                # read module codes
+                # collect module files, loaded in bulk after the walk
                 if file.endswith('.py'):
                     # determine module name
                     is_package = file == '__init__.py'
 
                     name = list(package_folder.parts)
-                    name += [file.split('.')[0]] if not is_package else []
+                    name += [splitext(file)[0]] if not is_package else []
 
                     name = '.'.join(name)
 
-                    # load module code
-                    code = read_source(source_file)
+                    py_files.append((source_file, name, is_package))
 
+                # copy resource files
+                else:
                     if resources:
-                        code = file_to_resource_transform(code)
+                        # create the resource folder once per directory, not per file
+                        if not resource_folder_created:
+                            makedirs(resource_folder, exist_ok=True)
+                            resource_folder_created = True
 
-                    # check code for invalid imports
-                    if name == '__main__' and has_relative_import(code):
-                        raise ValueError(f'{source_file} contains a relative import, which is forbidden')
+                        copy(source_file, resource_folder.joinpath(file), follow_symlinks=True)
 
-                    if name != '__main__' and has_absolute_import_of_module(code, source.name):
-                        raise ValueError(
-                            f'{source_file} contains an absolute import of {source.name}, which is forbidden')
+        # load and check module codes, in parallel for larger projects where
+        # the worker pool startup cost is amortized
+        loader = partial(_load_module, root_name=source.name, resources=resources)
 
-                    # assign to module dictionay
-                    modules[name] = (code, is_package)
+        if len(py_files) > 32:
+            with ProcessPoolExecutor() as executor:
+                results = list(executor.map(loader, py_files))
+        else:
+            results = map(loader, py_files)
 
-                # copy resource files
-                else:
-                    if resources:
-                        makedirs(resource_folder, exist_ok=True)
-                        copy(source_file, resource_folder.joinpath(file), follow_symlinks=True)
+        # assign to module dictionay
+        for name, code, is_package in results:
+            modules[name] = (code, is_package)
 
         if len(modules) == 0:
             raise ValueError('no modules found')
 
-        # create all missing intermediate packages
+        # create all missing intermediate packages; walk each name upwards and
+        # stop at the first existing entry, whose own parents are either filled
+        # already or get filled when their name is processed
         for name in list(modules.keys()):
-            parts = name.split('.')
-            for i in range(0, len(parts)):
-                package = '.'.join(parts[0:i])
-                if package not in modules:
-                    modules[package] = ('', True)
+            package = name.rpartition('.')[0]
+            while package not in modules:
+                modules[package] = ('', True)
+                package = package.rpartition('.')[0]
 
         # ensure stable ordering
         modules = OrderedDict(sorted(modules.items(), key=lambda i: i[0]))
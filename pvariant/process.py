@@ -23,6 +23,9 @@ def perform(
     if zip_:
         assert not target.is_absolute(), 'target path is expected to be relative'
 
+    # filter paths as a set, probed once per walked file and folder
+    filter_set = frozenset(filters)
+
     # list of temporary files and folders
     tmps: List[Path] = []
 
@@ -70,10 +73,10 @@ def perform(
 
                 # filter entries to be ignored (folders need to be modified in-place to take effect for os.walk)
                 def _folder_filter(folder: Path):
-                    return not fnmatch_any(folder.name, ['__pycache__', '.git']) and folder not in filters
+                    return not fnmatch_any(folder.name, ('__pycache__', '.git')) and folder not in filter_set
 
                 def _file_filter(file: Path):
-                    return not fnmatch_any(file.name, ['*.pyc']) and file not in filters
+                    return not fnmatch_any(file.name, ('*.pyc',)) and file not in filter_set
 
                 folders[:] = [folder for folder in folders if _folder_filter(source_folder.joinpath(folder))]
                 files = [file for file in files if _file_filter(source_folder.joinpath(file))]
@@ -1,8 +1,8 @@
 import ast
-from functools import reduce
+from functools import lru_cache, reduce
 from pathlib import Path
 
-from pdistx.utils.source import (ast_parse, ast_unparse, read_source, write_source)
+from pdistx.utils.source import ast_parse, read_source_text, write_source_tree
 
 
 class VariantTransform(ast.NodeTransformer):
@@ -38,7 +38,7 @@ class VariantTransform(ast.NodeTransformer):
     def visit_BoolOp(self, node: ast.BoolOp):
         node = self.generic_visit(node)
 
-        if reduce(lambda a, b: a and b, map(lambda v: isinstance(v, ast.Constant), node.values), True):
+        if all(isinstance(v, ast.Constant) for v in node.values):
             values = map(lambda value: value.value, node.values)
             if isinstance(node.op, ast.And):
                 return ast.Constant(reduce(lambda a, b: a and b, values, True))
@@ -84,7 +84,7 @@ class VariantTransform(ast.NodeTransformer):
                     return ast.Constant(left.value is not right.value)
 
             if isinstance(left, ast.Constant) and isinstance(right, (ast.List, ast.Tuple)):
-                if reduce(lambda a, b: a and b, [isinstance(child, ast.Constant) for child in right.elts], True):
+                if all(isinstance(child, ast.Constant) for child in right.elts):
                     right_values = [child.value for child in right.elts]
                     if isinstance(op, ast.In):
                         return ast.Constant(left.value in right_values)
@@ -116,16 +116,23 @@ class VariantTransform(ast.NodeTransformer):
         return node
 
 
+@lru_cache(maxsize=256)
+def _variant_transform_tree(source: str, definitions_key: tuple):
+    # memoized on source content, so duplicate files (e.g. empty __init__.py)
+    # are parsed and transformed only once; the cached tree is only unparsed
+    # afterwards, never mutated
+    tree = ast_parse(source)
+    tree = VariantTransform(dict(definitions_key)).visit(tree)
+    return ast.fix_missing_locations(tree)
+
+
 def variant_transform(source_path: Path, target_path: Path, definitions: dict):
 
     # read file
-    source = read_source(source_path)
+    source = read_source_text(source_path)
 
     # transform
-    tree = ast_parse(source)
-    tree = VariantTransform(definitions).visit(tree)
-    tree = ast.fix_missing_locations(tree)
-    target = ast_unparse(tree)
+    tree = _variant_transform_tree(source, tuple(sorted(definitions.items())))
 
     # write file
-    write_source(target_path, target)
+    write_source_tree(target_path, tree)
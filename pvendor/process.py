@@ -30,6 +30,9 @@ def perform(
     if zip_:
         assert not target.is_absolute(), 'target path is expected to be relative'
 
+    # keep patterns as a tuple, required by the memoized fnmatch_any
+    keep_patterns = tuple(keep)
+
     # list of temporary files and folders
     tmps: List[Path] = []
 
@@ -66,7 +69,7 @@ def perform(
                 # if target is not a zip, remove all except the entries to be kept
                 if not zip_:
                     for name in listdir(target):
-                        if not fnmatch_any(name, keep):
+                        if not fnmatch_any(name, keep_patterns):
                             path = target.joinpath(name)
                             rmpath(path)
 
@@ -88,7 +91,7 @@ def perform(
                 path = source.joinpath(entry)
 
                 if path.is_dir():
-                    if fnmatch_any(entry, ['*.dist-info', '*.egg-info', 'bin', '__pycache__', '.git']):
+                    if fnmatch_any(entry, ('*.dist-info', '*.egg-info', 'bin', '__pycache__', '.git')):
                         continue
                     name = entry
 
@@ -113,6 +116,9 @@ def perform(
             makedirs(target, exist_ok=True)
             intermediate = target
 
+        # module name set for import transformation, computed once
+        module_names = frozenset(modules)
+
         # copy and transform all module files
         for name, source in modules.items():
             print(f'Processing {name} from {source}...')
@@ -121,8 +127,8 @@ def perform(
             if source.is_dir():
                 for source_folder, folders, files in walk(source, followlinks=True):
                     # filter entries to be ignored (folders need to be modified in-place to take effect for os.walk)
-                    folders[:] = [folder for folder in folders if not fnmatch_any(folder, ['__pycache__', '.git'])]
-                    files = [file for file in files if not fnmatch_any(file, ['*.pyc'])]
+                    folders[:] = [folder for folder in folders if not fnmatch_any(folder, ('__pycache__', '.git'))]
+                    files = [file for file in files if not fnmatch_any(file, ('*.pyc',))]
 
                     # ensure sub target directory exists
                     source_folder = Path(source_folder)
@@ -138,13 +144,13 @@ def perform(
                         target_file = target_folder.joinpath(file)
 
                         if file.endswith('.py'):
-                            import_transform(source_file, target_file, level, list(modules.keys()))
+                            import_transform(source_file, target_file, level, module_names)
                         else:
                             copy(source_file, target_file, follow_symlinks=True)
 
             # handle file case
             else:
-                import_transform(source, intermediate.joinpath(name + '.py'), 1, list(modules.keys()))
+                import_transform(source, intermediate.joinpath(name + '.py'), 1, module_names)
 
         # create empty init file in target folder
         write_source(intermediate.joinpath('__init__.py'), '')
@@ -1,8 +1,16 @@
 import ast
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import FrozenSet
 
-from pdistx.utils.source import (ast_parse, ast_unparse, read_source, write_source)
+from pdistx.utils.source import ast_parse, read_source_text, write_source_tree
+
+
+def _is_vendored(name: str, modules):
+    # the top-level package decides whether an import needs rewriting; stdlib
+    # and other non-vendored imports fall through here without any further
+    # work, and partition avoids building a list per probe
+    return name.partition('.')[0] in modules
 
 
 class _ImportNameStringTransform(ast.NodeTransformer):
@@ -28,7 +36,7 @@ class _ImportNameStringTransform(ast.NodeTransformer):
         node = self.generic_visit(node)
 
         if isinstance(node.value, str):
-            if node.value.split('.')[0] in self._modules:
+            if _is_vendored(node.value, self._modules):
                 self.string_rewrite_applied = True
                 return ast.Call(
                     func=ast.Attribute(value=ast.Constant(value='.'), attr='join', ctx=ast.Load()),
@@ -82,7 +90,7 @@ class ImportTransform(ast.NodeTransformer):
         nodes = []
         for name in node.names:
             # Keep "import abc.def" and "import abc.def as xyz" for non included modules
-            if name.name.split('.')[0] not in self._modules:
+            if not _is_vendored(name.name, self._modules):
                 nodes.append(ast.Import([name]))
                 continue
 
@@ -156,7 +164,7 @@ class ImportTransform(ast.NodeTransformer):
         node = self.generic_visit(node)
 
         # Rewrite "from abc import def (as xyz)" to "from ..abc import def (as xyz)"
-        if node.level == 0 and node.module.split('.')[0] in self._modules:
+        if node.level == 0 and _is_vendored(node.module, self._modules):
             return ast.ImportFrom(
                 module=node.module,
                 names=node.names,
@@ -175,8 +183,8 @@ class ImportTransform(ast.NodeTransformer):
             if node.func.id == '__import__' and len(node.args) <= 5:
 
                 # we do not support *x and **x
-                has_starred = len([x for x in node.args if isinstance(x, ast.Starred)]) > 0
-                has_kwargs_list = len([x for x in node.keywords if not x.arg]) > 0
+                has_starred = any(isinstance(x, ast.Starred) for x in node.args)
+                has_kwargs_list = any(not x.arg for x in node.keywords)
 
                 if not has_starred and not has_kwargs_list:
 
@@ -213,8 +221,8 @@ class ImportTransform(ast.NodeTransformer):
             if node.func.id == 'import_module' and len(node.args) <= 2:
 
                 # we do not support *x and **x
-                has_starred = len([x for x in node.args if isinstance(x, ast.Starred)]) > 0
-                has_kwargs_list = len([x for x in node.keywords if not x.arg]) > 0
+                has_starred = any(isinstance(x, ast.Starred) for x in node.args)
+                has_kwargs_list = any(not x.arg for x in node.keywords)
 
                 if not has_starred and not has_kwargs_list:
 
@@ -241,16 +249,23 @@ class ImportTransform(ast.NodeTransformer):
         return node
 
 
-def import_transform(source_path: Path, target_path: Path, level: int, modules: List[str]):
+@lru_cache(maxsize=256)
+def _import_transform_tree(source: str, level: int, modules: FrozenSet[str]):
+    # memoized on source content, so duplicate files (e.g. empty __init__.py)
+    # are parsed and transformed only once; the cached tree is only unparsed
+    # afterwards, never mutated
+    tree = ast_parse(source)
+    tree = ImportTransform(level, modules).visit(tree)
+    return ast.fix_missing_locations(tree)
+
+
+def import_transform(source_path: Path, target_path: Path, level: int, modules: FrozenSet[str]):
 
     # read file
-    source = read_source(source_path)
+    source = read_source_text(source_path)
 
     # transform
-    tree = ast_parse(source)
-    tree = ImportTransform(level, modules).visit(tree)
-    tree = ast.fix_missing_locations(tree)
-    target = ast_unparse(tree)
+    tree = _import_transform_tree(source, level, modules)
 
     # write file
-    write_source(target_path, target)
+    write_source_tree(target_path, tree)